@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Console I/O
+Input/output abstraction used by the interactive tools so they can run
+against a real terminal or a scripted session (see load_test.ScriptedIO)
+"""
+
+import builtins
+
+
+class ConsoleIO:
+    """Terminal I/O backed by the built-in input() and print()"""
+
+    def input(self, prompt=""):
+        """Read one line of user input"""
+        return builtins.input(prompt)
+
+    def print(self, *values, sep=" ", end="\n"):
+        """Write values to the terminal"""
+        builtins.print(*values, sep=sep, end=end)
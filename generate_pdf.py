@@ -4,16 +4,17 @@ PDF Generator for Python Projects
 Generates a comprehensive PDF document with code, screenshots, and analysis
 """
 
-from reportlab.lib.pagesizes import letter, A4
+from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Image, Table, TableStyle, Preformatted
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Preformatted
 from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
-from reportlab.pdfgen import canvas
-import subprocess
-import os
+from reportlab.lib.enums import TA_CENTER
 from datetime import datetime
+import os
+
+# Project sources are read from next to this file, not the working directory
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class PDFGenerator:
     def __init__(self, filename="Python_Projects_Portfolio.pdf"):
@@ -168,7 +169,7 @@ class PDFGenerator:
         self.add_title_page()
 
         # Project 1: Calculator
-        with open('calculator.py', 'r') as f:
+        with open(os.path.join(SOURCE_DIR, 'calculator.py'), 'r') as f:
             calc_code = f.read()
 
         calc_output = [
@@ -254,7 +255,7 @@ Thank you for using the calculator!"""
                                 calc_output, calc_explanation, calc_analysis)
 
         # Project 2: Number Guessing Game
-        with open('number_guessing_game.py', 'r') as f:
+        with open(os.path.join(SOURCE_DIR, 'number_guessing_game.py'), 'r') as f:
             game_code = f.read()
 
         game_output = [
@@ -335,7 +336,7 @@ Thanks for playing! Goodbye!"""
                                 game_output, game_explanation, game_analysis)
 
         # Project 3: Password Generator
-        with open('password_generator.py', 'r') as f:
+        with open(os.path.join(SOURCE_DIR, 'password_generator.py'), 'r') as f:
             pwd_code = f.read()
 
         pwd_output = [
@@ -439,6 +440,10 @@ Thank you for using Password Generator!"""
         self.doc.build(self.story)
         print(f"PDF generated successfully: {self.filename}")
 
-if __name__ == "__main__":
+def generate_pdf():
+    """Build the portfolio PDF in the current directory"""
     generator = PDFGenerator()
     generator.generate()
+
+if __name__ == "__main__":
+    generate_pdf()
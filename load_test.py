@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Headless Load Tester
+Replays recorded input scripts against many headless instances of the
+interactive tools and reports throughput and per-prompt latency:
+
+    python -m load_test calc --sessions 5000 --workers 8
+    python -m load_test guess --script recorded_session.txt
+
+A script file holds one user input per line. Output is captured in
+preallocated in-memory buffers, so no terminal is required. Latencies are
+aggregated into fixed-size histograms, so memory does not grow with the
+number of sessions.
+
+Sessions are pure Python and CPU-bound, so each worker is a separate
+process: throughput scales with the number of CPU cores, and per-prompt
+latency is not inflated by waiting on another worker's GIL.
+"""
+
+import argparse
+import math
+import random
+import time
+import traceback
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+# Default recorded sessions, one input per prompt
+DEFAULT_SCRIPTS = {
+    'calc': ['1', '25', '17', '3', '8', '7', '4', '100', '0',
+             '2', 'abc', '9', '5'],
+    # Sweeps the range so every secret number ends the game within ten
+    # attempts; a leftover guess after a win is read as "don't play again".
+    'guess': ['50', '0', '10', '20', '30', '40', '60', '70', '80',
+              '90', '100', 'no'],
+    'password': ['4', '16', 'y', 'y', 'y', 'y', 'y',
+                 '8', 'n', 'y', 'n', 'n', 'n'],
+}
+
+
+class LatencyHistogram:
+    """
+    Fixed-size, log-bucketed histogram of latencies in seconds
+
+    Buckets grow by a factor of 2 ** (1 / STEPS) (about 9%) from MINIMUM,
+    so percentiles are accurate to within one bucket while storage stays
+    constant. Count, sum and maximum are tracked exactly.
+    """
+
+    MINIMUM = 1e-7
+    STEPS = 8
+    BUCKETS = 256
+
+    def __init__(self):
+        self.buckets = array('Q', [0]) * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, value):
+        """Record one latency"""
+        if value <= self.MINIMUM:
+            index = 0
+        else:
+            index = min(self.BUCKETS - 1,
+                        int(math.log2(value / self.MINIMUM) * self.STEPS) + 1)
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other):
+        """Add another histogram's samples to this one"""
+        for index, count in enumerate(other.buckets):
+            self.buckets[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def mean(self):
+        """Return the mean latency"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """Return the upper bound of the bucket holding the given fraction"""
+        rank = math.ceil(fraction * self.count)
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                upper = self.MINIMUM * 2 ** (index / self.STEPS)
+                return min(upper, self.maximum)
+        return self.maximum
+
+
+class ScriptedIO:
+    """
+    Replays a recorded input script and captures output in memory
+
+    Output is written into a preallocated byte buffer instead of stdout;
+    text beyond the buffer's capacity is dropped and flagged as truncated.
+    The time spent between prompts (from handing back an answer until the
+    tool asks for the next one) is recorded for each prompt.
+
+    Args:
+        capacity: Size of the output buffer in bytes (default: 64 KiB)
+        max_prompts: Number of latency slots to preallocate (default: 256)
+    """
+
+    def __init__(self, capacity=64 * 1024, max_prompts=256):
+        self.buffer = bytearray(capacity)
+        self.latencies = array('d', [0.0]) * max_prompts
+        self.reset(())
+
+    def reset(self, script):
+        """Start a new session with the given input lines, reusing buffers"""
+        self._script = iter(script)
+        self.length = 0
+        self.prompts = 0
+        self.truncated = False
+        self._last = time.perf_counter()
+
+    def _write(self, text):
+        data = text.encode()
+        end = self.length + len(data)
+        if end > len(self.buffer):
+            self.truncated = True
+            end = len(self.buffer)
+        self.buffer[self.length:end] = data[:end - self.length]
+        self.length = end
+
+    def input(self, prompt=""):
+        """Return the next scripted line, raising EOFError when exhausted"""
+        now = time.perf_counter()
+        if self.prompts < len(self.latencies):
+            self.latencies[self.prompts] = now - self._last
+        self.prompts += 1
+        self._write(prompt)
+
+        line = next(self._script, None)
+        if line is None:
+            raise EOFError("input script exhausted")
+        self._write(line + "\n")
+        self._last = time.perf_counter()
+        return line
+
+    def print(self, *values, sep=" ", end="\n"):
+        """Append values to the output buffer"""
+        self._write(sep.join(str(value) for value in values) + end)
+
+    def output(self):
+        """Return the captured output as text"""
+        return self.buffer[:self.length].decode(errors="replace")
+
+
+def _load_tool(tool):
+    """Return a callable that runs one session of the tool against an I/O"""
+    if tool == 'calc':
+        from calculator import calculator
+        return lambda console, seed: calculator(console)
+    if tool == 'guess':
+        from number_guessing_game import number_guessing_game
+        return lambda console, seed: number_guessing_game(
+            console, random.Random(seed))
+    if tool == 'password':
+        from password_generator import password_generator
+        return lambda console, seed: password_generator(console)
+    raise ValueError(f"Unknown tool: {tool}")
+
+
+def load_script(path):
+    """Read a recorded input script, one input per line"""
+    with open(path, 'r') as f:
+        return f.read().splitlines()
+
+
+def _run_worker(tool, script, first, count, capacity):
+    """
+    Run sessions [first, first + count) on one preallocated ScriptedIO
+
+    Returns:
+        Tuple of (elapsed, histogram, incomplete, truncated, failures),
+        where elapsed covers only the session loop and failures maps
+        exception type names to [count, first traceback]
+    """
+    run_session = _load_tool(tool)
+    max_prompts = len(script) + 1
+    console = ScriptedIO(capacity=capacity, max_prompts=max_prompts)
+    histogram = LatencyHistogram()
+    incomplete = truncated = 0
+    failures = {}
+
+    start = time.perf_counter()
+    for seed in range(first, first + count):
+        console.reset(script)
+        try:
+            run_session(console, seed)
+        except EOFError:
+            incomplete += 1
+        except Exception as error:
+            failure = failures.setdefault(
+                type(error).__name__, [0, traceback.format_exc()])
+            failure[0] += 1
+        if console.truncated:
+            truncated += 1
+
+        latencies = console.latencies
+        for index in range(min(console.prompts, max_prompts)):
+            histogram.add(latencies[index])
+    elapsed = time.perf_counter() - start
+
+    return elapsed, histogram, incomplete, truncated, failures
+
+
+def run_load_test(tool, script=None, sessions=1000, workers=8,
+                  capacity=64 * 1024):
+    """
+    Replay an input script against many concurrent tool sessions
+
+    Args:
+        tool: Tool to exercise ('calc', 'guess' or 'password')
+        script: Input lines to replay (default: the tool's DEFAULT_SCRIPTS)
+        sessions: Total number of sessions to run (default: 1000)
+        workers: Number of worker processes running sessions in parallel
+            (default: 8)
+        capacity: Output buffer size per worker in bytes (default: 64 KiB)
+
+    Throughput is computed from the time workers spend running sessions,
+    excluding process startup and each worker's first import of the tool.
+
+    Returns:
+        Dictionary with throughput, latency percentiles (seconds),
+        counts of incomplete, failed and truncated sessions, and the
+        failures by exception type with the first traceback of each
+    """
+    if tool not in DEFAULT_SCRIPTS:
+        raise ValueError(f"Unknown tool: {tool}")
+    for label, value in (('sessions', sessions), ('workers', workers),
+                         ('capacity', capacity)):
+        if value < 1:
+            raise ValueError(f"{label} must be a positive integer, got {value}")
+
+    script = DEFAULT_SCRIPTS[tool] if script is None else list(script)
+    workers = max(1, min(workers, sessions))
+
+    share, extra = divmod(sessions, workers)
+    batches = []
+    first = 0
+    for index in range(workers):
+        count = share + (1 if index < extra else 0)
+        batches.append((first, count))
+        first += count
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_worker, tool, script, first, count,
+                               capacity)
+                   for first, count in batches]
+        results = [future.result() for future in futures]
+
+    # Workers run in parallel, so the slowest one bounds the run
+    elapsed = max(result[0] for result in results)
+    histogram = LatencyHistogram()
+    failures = {}
+    for result in results:
+        histogram.merge(result[1])
+        for name, (count, trace) in result[4].items():
+            failures.setdefault(name, [0, trace])[0] += count
+
+    return {
+        'tool': tool,
+        'sessions': sessions,
+        'workers': workers,
+        'elapsed': elapsed,
+        'sessions_per_second': sessions / elapsed if elapsed else 0.0,
+        'prompts': histogram.count,
+        'latency_mean': histogram.mean(),
+        'latency_p50': histogram.percentile(0.50),
+        'latency_p95': histogram.percentile(0.95),
+        'latency_p99': histogram.percentile(0.99),
+        'latency_max': histogram.maximum,
+        'incomplete': sum(result[2] for result in results),
+        'truncated': sum(result[3] for result in results),
+        'errors': sum(count for count, _ in failures.values()),
+        'failures': failures,
+    }
+
+
+def print_report(report):
+    """Print a load test report"""
+    print("=" * 50)
+    print(f"LOAD TEST REPORT: {report['tool']}")
+    print("=" * 50)
+    print(f"Sessions: {report['sessions']} on {report['workers']} worker processes")
+    print(f"Elapsed (session loops): {report['elapsed']:.3f} s")
+    print(f"Throughput: {report['sessions_per_second']:.1f} sessions/s")
+    print(f"\nPer-prompt latency ({report['prompts']} prompts):")
+    for label in ('mean', 'p50', 'p95', 'p99', 'max'):
+        print(f"  {label:<5}{report['latency_' + label] * 1e6:>12.1f} us")
+    print(f"\nIncomplete sessions (script exhausted): {report['incomplete']}")
+    print(f"Failed sessions: {report['errors']}")
+    print(f"Truncated outputs: {report['truncated']}")
+    for name, (count, trace) in report['failures'].items():
+        print(f"\n{name}: {count} session(s), first traceback:")
+        print(trace.rstrip())
+
+
+def _positive_int(value):
+    """argparse type for integers of at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Soak-test the interactive tools with recorded input")
+    parser.add_argument('tool', choices=sorted(DEFAULT_SCRIPTS))
+    parser.add_argument('--script', help="file with one input per line")
+    parser.add_argument('--sessions', type=_positive_int, default=1000)
+    parser.add_argument('--workers', type=_positive_int, default=8,
+                        help="worker processes running sessions in parallel")
+    parser.add_argument('--capacity', type=_positive_int, default=64 * 1024,
+                        help="output buffer size per worker in bytes")
+    args = parser.parse_args(argv)
+
+    script = load_script(args.script) if args.script else None
+    report = run_load_test(args.tool, script, args.sessions, args.workers,
+                           args.capacity)
+    print_report(report)
+    return 1 if report['errors'] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,53 +6,62 @@ A fun game where the player tries to guess a randomly generated number
 
 import random
 
-def number_guessing_game():
-    """Main game function"""
-    print("=" * 50)
-    print("NUMBER GUESSING GAME")
-    print("=" * 50)
-    print("\nWelcome! I'm thinking of a number between 1 and 100.")
-    print("Can you guess what it is?")
+from console_io import ConsoleIO
+
+def number_guessing_game(console=None, rng=random):
+    """
+    Main game function
+
+    Args:
+        console: I/O to play against (default: the terminal)
+        rng: Source of the secret number (default: the random module)
+    """
+    console = console or ConsoleIO()
+    console.print("=" * 50)
+    console.print("NUMBER GUESSING GAME")
+    console.print("=" * 50)
+    console.print("\nWelcome! I'm thinking of a number between 1 and 100.")
+    console.print("Can you guess what it is?")
 
     # Generate random number
-    secret_number = random.randint(1, 100)
+    secret_number = rng.randint(1, 100)
     attempts = 0
     max_attempts = 10
 
     while attempts < max_attempts:
         try:
-            guess = int(input(f"\nAttempt {attempts + 1}/{max_attempts} - Enter your guess: "))
+            guess = int(console.input(f"\nAttempt {attempts + 1}/{max_attempts} - Enter your guess: "))
             attempts += 1
 
             if guess < 1 or guess > 100:
-                print("Please guess a number between 1 and 100!")
+                console.print("Please guess a number between 1 and 100!")
                 attempts -= 1  # Don't count invalid attempts
                 continue
 
             if guess < secret_number:
-                print("Too low! Try a higher number.")
+                console.print("Too low! Try a higher number.")
             elif guess > secret_number:
-                print("Too high! Try a lower number.")
+                console.print("Too high! Try a lower number.")
             else:
-                print(f"\n🎉 Congratulations! You guessed it!")
-                print(f"The number was {secret_number}")
-                print(f"You won in {attempts} attempts!")
+                console.print(f"\n🎉 Congratulations! You guessed it!")
+                console.print(f"The number was {secret_number}")
+                console.print(f"You won in {attempts} attempts!")
                 break
 
         except ValueError:
-            print("Invalid input! Please enter a valid number.")
+            console.print("Invalid input! Please enter a valid number.")
             attempts -= 1  # Don't count invalid attempts
 
     else:
-        print(f"\n💔 Game Over! You've used all {max_attempts} attempts.")
-        print(f"The secret number was: {secret_number}")
+        console.print(f"\n💔 Game Over! You've used all {max_attempts} attempts.")
+        console.print(f"The secret number was: {secret_number}")
 
     # Ask to play again
-    play_again = input("\nWould you like to play again? (yes/no): ")
+    play_again = console.input("\nWould you like to play again? (yes/no): ")
     if play_again.lower() in ['yes', 'y']:
-        number_guessing_game()
+        number_guessing_game(console, rng)
     else:
-        print("Thanks for playing! Goodbye!")
+        console.print("Thanks for playing! Goodbye!")
 
 if __name__ == "__main__":
     number_guessing_game()
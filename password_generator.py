@@ -7,6 +7,8 @@ Generates secure random passwords based on user preferences
 import random
 import string
 
+from console_io import ConsoleIO
+
 def generate_password(length=12, use_uppercase=True, use_lowercase=True,
                      use_digits=True, use_symbols=True):
     """
@@ -56,36 +58,37 @@ def generate_password(length=12, use_uppercase=True, use_lowercase=True,
 
     return ''.join(password)
 
-def password_generator():
+def password_generator(console=None):
     """Main password generator function"""
-    print("=" * 50)
-    print("SECURE PASSWORD GENERATOR")
-    print("=" * 50)
+    console = console or ConsoleIO()
+    console.print("=" * 50)
+    console.print("SECURE PASSWORD GENERATOR")
+    console.print("=" * 50)
 
     while True:
-        print("\nPassword Configuration:")
+        console.print("\nPassword Configuration:")
 
         try:
-            length = int(input("Enter password length (8-128): "))
+            length = int(console.input("Enter password length (8-128): "))
             if length < 8 or length > 128:
-                print("Password length must be between 8 and 128!")
+                console.print("Password length must be between 8 and 128!")
                 continue
         except ValueError:
-            print("Invalid input! Please enter a number.")
+            console.print("Invalid input! Please enter a number.")
             continue
 
-        use_uppercase = input("Include uppercase letters? (y/n): ").lower() == 'y'
-        use_lowercase = input("Include lowercase letters? (y/n): ").lower() == 'y'
-        use_digits = input("Include digits? (y/n): ").lower() == 'y'
-        use_symbols = input("Include symbols? (y/n): ").lower() == 'y'
+        use_uppercase = console.input("Include uppercase letters? (y/n): ").lower() == 'y'
+        use_lowercase = console.input("Include lowercase letters? (y/n): ").lower() == 'y'
+        use_digits = console.input("Include digits? (y/n): ").lower() == 'y'
+        use_symbols = console.input("Include symbols? (y/n): ").lower() == 'y'
 
         # Generate password
         password = generate_password(length, use_uppercase, use_lowercase,
                                     use_digits, use_symbols)
 
-        print("\n" + "=" * 50)
-        print(f"Generated Password: {password}")
-        print("=" * 50)
+        console.print("\n" + "=" * 50)
+        console.print(f"Generated Password: {password}")
+        console.print("=" * 50)
 
         # Password strength analysis
         strength_score = 0
@@ -105,13 +108,13 @@ def password_generator():
         else:
             strength = "Weak ⚠️"
 
-        print(f"Password Strength: {strength}")
-        print(f"Length: {len(password)} characters")
+        console.print(f"Password Strength: {strength}")
+        console.print(f"Length: {len(password)} characters")
 
         # Generate another password
-        another = input("\nGenerate another password? (y/n): ")
+        another = console.input("\nGenerate another password? (y/n): ")
         if another.lower() not in ['y', 'yes']:
-            print("Thank you for using Password Generator!")
+            console.print("Thank you for using Password Generator!")
             break
 
 if __name__ == "__main__":
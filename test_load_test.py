@@ -0,0 +1,85 @@
+"""Tests for the scripted I/O and load-test driver"""
+
+import pytest
+
+from load_test import (DEFAULT_SCRIPTS, LatencyHistogram, ScriptedIO,
+                       run_load_test)
+
+
+def test_scripted_io_replays_input_and_captures_output():
+    console = ScriptedIO()
+    console.reset(['1', 'two'])
+
+    assert console.input("first? ") == '1'
+    console.print("got", 1, sep=": ")
+    assert console.input("second? ") == 'two'
+
+    assert console.output() == "first? 1\ngot: 1\nsecond? two\n"
+    assert not console.truncated
+
+
+def test_scripted_io_raises_eof_when_script_exhausted():
+    console = ScriptedIO()
+    console.reset(['only'])
+    console.input()
+
+    with pytest.raises(EOFError):
+        console.input("again? ")
+    assert console.output().endswith("again? ")
+
+
+def test_scripted_io_truncates_output_at_capacity():
+    console = ScriptedIO(capacity=8)
+    console.reset(())
+    console.print("0123456789")
+
+    assert console.truncated
+    assert console.length == 8
+    assert console.output() == "01234567"
+
+    console.reset(())
+    console.print("ok")
+    assert not console.truncated
+    assert console.output() == "ok\n"
+
+
+def test_scripted_io_counts_prompts_beyond_latency_slots():
+    console = ScriptedIO(max_prompts=2)
+    console.reset(['a', 'b', 'c'])
+    for _ in range(3):
+        console.input()
+
+    assert console.prompts == 3
+    assert len(console.latencies) == 2
+    assert all(latency >= 0.0 for latency in console.latencies)
+
+
+def test_latency_histogram_percentiles_and_merge():
+    first = LatencyHistogram()
+    second = LatencyHistogram()
+    for _ in range(99):
+        first.add(1e-5)
+    second.add(1e-2)
+    first.merge(second)
+
+    assert first.count == 100
+    assert first.maximum == 1e-2
+    assert first.mean() == pytest.approx((99 * 1e-5 + 1e-2) / 100)
+    assert first.percentile(0.50) == pytest.approx(1e-5, rel=0.1)
+    assert first.percentile(1.0) == 1e-2
+
+
+@pytest.mark.parametrize('tool', sorted(DEFAULT_SCRIPTS))
+def test_default_scripts_complete(tool):
+    report = run_load_test(tool, sessions=20, workers=1)
+
+    assert report['incomplete'] == 0
+    assert report['errors'] == 0
+    assert report['truncated'] == 0
+    # A guessing game won early leaves the rest of its script unread
+    assert 0 < report['prompts'] <= 20 * len(DEFAULT_SCRIPTS[tool])
+
+
+def test_run_load_test_rejects_non_positive_counts():
+    with pytest.raises(ValueError):
+        run_load_test('calc', sessions=0)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unified Tool Launcher
+Runs any of the portfolio tools from a single entry point:
+
+    python -m tools calc
+    python -m tools guess
+    python -m tools password
+    python -m tools pdf
+    python -m tools --import-report pdf
+
+Each tool module (and its dependencies, e.g. reportlab for the PDF
+builder) is imported only when its subcommand runs, so startup stays cheap.
+"""
+
+import sys
+
+# subcommand -> (module, entry point, description)
+TOOLS = {
+    'calc': ('calculator', 'calculator', "Simple calculator"),
+    'guess': ('number_guessing_game', 'number_guessing_game', "Number guessing game"),
+    'password': ('password_generator', 'password_generator', "Secure password generator"),
+    'pdf': ('generate_pdf', 'generate_pdf', "Build the portfolio PDF in the current directory"),
+}
+
+REPORT_TOP = 15
+
+
+def usage():
+    """Return the usage text"""
+    lines = ["usage: python -m tools [--import-report] <tool>", "", "tools:"]
+    for name, (_, _, description) in TOOLS.items():
+        lines.append(f"  {name:<10}{description}")
+    return "\n".join(lines)
+
+
+def run_tool(name):
+    """Import the tool's module on demand and run it"""
+    module_name, entry, _ = TOOLS[name]
+    module = __import__(module_name)
+    getattr(module, entry)()
+
+
+def import_report(name, top=REPORT_TOP):
+    """
+    Print an import-time breakdown for a tool's module
+
+    Imports the module in a fresh interpreter with ``-X importtime`` and
+    summarizes the slowest imports by cumulative time. Only the subtree
+    under the tool's own module is reported, so interpreter startup
+    imports (site, encodings, ...) do not mask changes in the tool.
+
+    Args:
+        name: Subcommand whose module should be measured
+        top: Number of entries to show (default: REPORT_TOP)
+
+    Returns:
+        Exit status of the measuring interpreter
+    """
+    import os
+    import subprocess
+
+    module_name = TOOLS[name][0]
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module_name}"],
+        capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        print(lines[-1] if lines
+              else f"import of {module_name} failed ({result.returncode})",
+              file=sys.stderr)
+        return result.returncode
+
+    # Nested imports are listed before their parent, indented two spaces
+    # per level; collect everything up to the tool's top-level entry.
+    entries = []
+    pending = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, package = line[len("import time:"):].split("|", 2)
+        package = package[1:]
+        pending.append((int(cumulative_us), int(self_us), package.strip()))
+        if not package.startswith(" "):
+            if package == module_name:
+                entries = pending
+                break
+            pending = []
+
+    total = entries[-1][0] if entries else 0
+    print("=" * 50)
+    print(f"IMPORT TIME REPORT: {name} ({module_name})")
+    print("=" * 50)
+    print(f"{'cumulative [us]':>16} {'self [us]':>10}  module")
+    for cumulative_us, self_us, package in sorted(entries, reverse=True)[:top]:
+        print(f"{cumulative_us:>16} {self_us:>10}  {package}")
+    print(f"\nModules imported: {len(entries)}")
+    print(f"Total import time: {total / 1000:.1f} ms")
+    return 0
+
+
+def main(argv=None):
+    """Parse the command line and dispatch to a tool"""
+    args = sys.argv[1:] if argv is None else list(argv)
+
+    report = '--import-report' in args
+    if report:
+        args.remove('--import-report')
+
+    if len(args) != 1 or args[0] in ('-h', '--help'):
+        print(usage())
+        return 0 if args[:1] in (['-h'], ['--help']) else 2
+
+    name = args[0]
+    if name not in TOOLS:
+        print(f"Unknown tool: {name}\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    if report:
+        return import_report(name)
+
+    run_tool(name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())